@@ -93,6 +93,12 @@ def test_brotlipy(session: nox.Session) -> None:
     tests_impl(session, extras="socks,secure", byte_string_comparisons=False)
 
 
+@nox.session(python=["3"])
+def test_zlib_ng(session: nox.Session) -> None:
+    """Run the test suite with 'zlib-ng' decoding deflate and gzip content."""
+    tests_impl(session, extras="socks,secure,brotli,zstd,zlib-ng")
+
+
 def git_clone(session: nox.Session, git_url: str) -> None:
     """We either clone the target repository or if already exist
     simply reset the state and pull.
@@ -8,12 +8,22 @@ import re
 import sys
 import typing
 import warnings
-import zlib
+import zlib as _stdlib_zlib
 from contextlib import contextmanager
 from http.client import HTTPMessage as _HttplibHTTPMessage
 from http.client import HTTPResponse as _HttplibHTTPResponse
 from socket import timeout as SocketTimeout
 
+# zlib-ng is an opt-in, API compatible replacement for zlib that's used
+# for the deflate and gzip decoders when installed (``urllib3[zlib-ng]``).
+if typing.TYPE_CHECKING:
+    import zlib as zlib
+else:
+    try:
+        from zlib_ng import zlib_ng as zlib
+    except ImportError:
+        import zlib
+
 try:
     try:
         import brotlicffi as brotli  # type: ignore[import]
@@ -281,7 +291,10 @@ class BaseHTTPResponse(io.IOBase):
         CONTENT_DECODERS += ["zstd"]
     REDIRECT_STATUSES = [301, 302, 303, 307, 308]
 
-    DECODER_ERROR_CLASSES: tuple[type[Exception], ...] = (IOError, zlib.error)
+    DECODER_ERROR_CLASSES: tuple[type[Exception], ...] = (IOError, _stdlib_zlib.error)
+    if zlib is not _stdlib_zlib:
+        # zlib_ng.error isn't a subclass of zlib.error.
+        DECODER_ERROR_CLASSES += (zlib.error,)
     if brotli is not None:
         DECODER_ERROR_CLASSES += (brotli.error,)
 
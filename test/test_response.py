@@ -6,8 +6,7 @@ import socket
 import ssl
 import sys
 import typing
-import zlib
-from base64 import b64decode
+from collections import deque
 from http.client import IncompleteRead as httplib_IncompleteRead
 from io import BufferedReader, BytesIO, TextIOWrapper
 from test import onlyBrotli, onlyZstd
@@ -31,6 +30,7 @@ from urllib3.response import (  # type: ignore[attr-defined]
     BytesQueueBuffer,
     HTTPResponse,
     brotli,
+    zlib,
     zstd,
 )
 from urllib3.util.response import is_fp_closed
@@ -86,21 +86,54 @@ class TestBytesQueueBuffer:
         assert len(buffer.get(10 * 2**20)) == 10 * 2**20
 
 
+def _compress(data: bytes, wbits: int) -> bytes:
+    compress = zlib.compressobj(6, zlib.DEFLATED, wbits)
+    return compress.compress(data) + compress.flush()
+
+
+# Compressed b"foo" fixtures shared by the decoding tests, built once at import.
+DEFLATE_FOO = zlib.compress(b"foo")
+RAW_DEFLATE_FOO = _compress(b"foo", -zlib.MAX_WBITS)
+GZIP_FOO = _compress(b"foo", 16 + zlib.MAX_WBITS)
+
+# (content-encoding header, body) pairs that all decode to b"foo".
+ENCODED_FOO_CASES = [
+    pytest.param("deflate", DEFLATE_FOO, id="deflate"),
+    pytest.param("deflate", RAW_DEFLATE_FOO, id="raw-deflate"),
+    pytest.param("gzip", GZIP_FOO, id="gzip"),
+    pytest.param("DeFlAtE", DEFLATE_FOO, id="case-insensitive"),
+]
+
+# Retry objects aren't mutated by HTTPResponse, so tests that only check
+# identity can share one instance.
+DEFAULT_RETRY = Retry()
+
+# Default for next() when checking that a stream is exhausted.
+SENTINEL = object()
+
 # A known random (i.e, not-too-compressible) payload generated with:
 #    "".join(random.choice(string.printable) for i in range(512))
-#    .encode("zlib").encode("base64")
+#    .encode("zlib")
 # Randomness in tests == bad, and fixing a seed may not be sufficient.
-ZLIB_PAYLOAD = b64decode(
-    b"""\
-eJwFweuaoQAAANDfineQhiKLUiaiCzvuTEmNNlJGiL5QhnGpZ99z8luQfe1AHoMioB+QSWHQu/L+
-lzd7W5CipqYmeVTBjdgSATdg4l4Z2zhikbuF+EKn69Q0DTpdmNJz8S33odfJoVEexw/l2SS9nFdi
-pis7KOwXzfSqarSo9uJYgbDGrs1VNnQpT9f8zAorhYCEZronZQF9DuDFfNK3Hecc+WHLnZLQptwk
-nufw8S9I43sEwxsT71BiqedHo0QeIrFE01F/4atVFXuJs2yxIOak3bvtXjUKAA6OKnQJ/nNvDGKZ
-Khe5TF36JbnKVjdcL1EUNpwrWVfQpFYJ/WWm2b74qNeSZeQv5/xBhRdOmKTJFYgO96PwrHBlsnLn
-a3l0LwJsloWpMbzByU5WLbRE6X5INFqjQOtIwYz5BAlhkn+kVqJvWM5vBlfrwP42ifonM5yF4ciJ
-auHVks62997mNGOsM7WXNG3P98dBHPo2NhbTvHleL0BI5dus2JY81MUOnK3SGWLH8HeWPa1t5KcW
-S5moAj5HexY/g/F8TctpxwsvyZp38dXeLDjSQvEQIkF7XR3YXbeZgKk3V34KGCPOAeeuQDIgyVhV
-nP4HF2uWHA=="""
+ZLIB_PAYLOAD = (
+    b'x\x9c\x05\xc1\xeb\x9a\xa1\x00\x00\x00\xd0\xdf\x8aw\x90\x86"\x8bR&\xa2\x0b;'
+    b'\xeeLI\x8d6RF\x88\xbeP\x86q\xa9g\xdfs\xf2[\x90}\xed@\x1e\x83"\xa0\x1f\x90Ia'
+    b"\xd0\xbb\xf2\xfe\x977{[\x90\xa2\xa6\xa6&yT\xc1\x8d\xd8\x12\x017`\xe2^\x19\xdb"
+    b"8b\x91\xbb\x85\xf8B\xa7\xeb\xd44\r:]\x98\xd2s\xf1-\xf7\xa1\xd7\xc9\xa1Q\x1e"
+    b"\xc7\x0f\xe5\xd9$\xbd\x9cWb\xa6+;(\xec\x17\xcd\xf4\xaaj\xb4\xa8\xf6\xe2X\x81"
+    b"\xb0\xc6\xae\xcdU6t)O\xd7\xfc\xcc\n+\x85\x80\x84f\xba'e\x01}\x0e\xe0\xc5|\xd2"
+    b"\xb7\x1d\xe7\x1c\xf9a\xcb\x9d\x92\xd0\xa6\xdc$\x9e\xe7\xf0\xf1/H\xe3{\x04\xc3"
+    b'\x1b\x13\xefPb\xa9\xe7G\xa3D\x1e"\xb1D\xd3Q\x7f\xe1\xabU\x15{\x89\xb3l\xb1 '
+    b"\xe6\xa4\xdd\xbb\xed^5\n\x00\x0e\x8e*t\t\xfeso\x0cb\x99*\x17\xb9L]\xfa%\xb9"
+    b"\xcaV7\\/Q\x146\x9c+YW\xd0\xa4V\t\xfde\xa6\xd9\xbe\xf8\xa8\xd7\x92e\xe4/\xe7"
+    b"\xfcA\x85\x17N\x98\xa4\xc9\x15\x88\x0e\xf7\xa3\xf0\xacpe\xb2r\xe7kyt/\x02l"
+    b"\x96\x85\xa91\xbc\xc1\xc9NV-\xb4D\xe9~H4Z\xa3@\xebH\xc1\x8c\xf9\x04\ta\x92"
+    b"\x7f\xa4V\xa2oX\xceo\x06W\xeb\xc0\xfe6\x89\xfa'3\x9c\x85\xe1\xc8\x89j\xe1\xd5"
+    b"\x92\xce\xb6\xf7\xde\xe64c\xac3\xb5\x974m\xcf\xf7\xc7A\x1c\xfa66\x16\xd3\xbcy"
+    b"^/@H\xe5\xdb\xac\xd8\x96<\xd4\xc5\x0e\x9c\xad\xd2\x19b\xc7\xf0w\x96=\xadm\xe4"
+    b"\xa7\x16K\x99\xa8\x02>G{\x16?\x83\xf1|M\xcbi\xc7\x0b/\xc9\x9aw\xf1\xd5\xde,8"
+    b'\xd2B\xf1\x10"A{]\x1d\xd8]\xb7\x99\x80\xa97W~\n\x18#\xce\x01\xe7\xae@2 \xc9XU'
+    b"\x9c\xfe\x07\x17k\x96\x1c"
 )
 
 
@@ -181,75 +214,26 @@ class TestResponse:
         fp = BytesIO(b"foo")
         r = HTTPResponse(fp, preload_content=False)
 
-        assert r.read(1) == b"f"
-        assert r.read(2) == b"oo"
-        assert r.read() == b""
-        assert r.read() == b""
-
-    def test_decode_deflate(self) -> None:
-        data = zlib.compress(b"foo")
+        assert (r.read(1), r.read(2), r.read(), r.read()) == (b"f", b"oo", b"", b"")
 
+    @pytest.mark.parametrize("content_encoding, data", ENCODED_FOO_CASES)
+    def test_decode(self, content_encoding: str, data: bytes) -> None:
         fp = BytesIO(data)
-        r = HTTPResponse(fp, headers={"content-encoding": "deflate"})
+        r = HTTPResponse(fp, headers={"content-encoding": content_encoding})
 
         assert r.data == b"foo"
 
-    def test_decode_deflate_case_insensitve(self) -> None:
-        data = zlib.compress(b"foo")
-
-        fp = BytesIO(data)
-        r = HTTPResponse(fp, headers={"content-encoding": "DeFlAtE"})
-
-        assert r.data == b"foo"
-
-    def test_chunked_decoding_deflate(self) -> None:
-        data = zlib.compress(b"foo")
-
+    @pytest.mark.parametrize("content_encoding, data", ENCODED_FOO_CASES)
+    def test_chunked_decoding(self, content_encoding: str, data: bytes) -> None:
         fp = BytesIO(data)
         r = HTTPResponse(
-            fp, headers={"content-encoding": "deflate"}, preload_content=False
+            fp, headers={"content-encoding": content_encoding}, preload_content=False
         )
 
-        assert r.read(1) == b"f"
-        assert r.read(2) == b"oo"
-        assert r.read() == b""
-        assert r.read() == b""
-
-    def test_chunked_decoding_deflate2(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
-        data = compress.compress(b"foo")
-        data += compress.flush()
-
-        fp = BytesIO(data)
-        r = HTTPResponse(
-            fp, headers={"content-encoding": "deflate"}, preload_content=False
-        )
-
-        assert r.read(1) == b"f"
-        assert r.read(2) == b"oo"
-        assert r.read() == b""
-        assert r.read() == b""
-
-    def test_chunked_decoding_gzip(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        data = compress.compress(b"foo")
-        data += compress.flush()
-
-        fp = BytesIO(data)
-        r = HTTPResponse(
-            fp, headers={"content-encoding": "gzip"}, preload_content=False
-        )
-
-        assert r.read(1) == b"f"
-        assert r.read(2) == b"oo"
-        assert r.read() == b""
-        assert r.read() == b""
+        assert (r.read(1), r.read(2), r.read(), r.read()) == (b"f", b"oo", b"", b"")
 
     def test_decode_gzip_multi_member(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        data = compress.compress(b"foo")
-        data += compress.flush()
-        data = data * 3
+        data = GZIP_FOO * 3
 
         fp = BytesIO(data)
         r = HTTPResponse(fp, headers={"content-encoding": "gzip"})
@@ -265,10 +249,7 @@ class TestResponse:
         # When data comes from multiple calls to read(), data after
         # the first zlib error (here triggered by garbage) should be
         # ignored.
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        data = compress.compress(b"foo")
-        data += compress.flush()
-        data = data * 3 + b"foo"
+        data = GZIP_FOO * 3 + b"foo"
 
         fp = BytesIO(data)
         r = HTTPResponse(
@@ -283,10 +264,7 @@ class TestResponse:
         assert ret == b"foofoofoo"
 
     def test_chunked_decoding_gzip_swallow_garbage(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        data = compress.compress(b"foo")
-        data += compress.flush()
-        data = data * 3 + b"foo"
+        data = GZIP_FOO * 3 + b"foo"
 
         fp = BytesIO(data)
         r = HTTPResponse(fp, headers={"content-encoding": "gzip"})
@@ -363,9 +341,7 @@ class TestResponse:
         assert r.data == b"foo"
 
     def test_multi_decoding_deflate_gzip(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        data = compress.compress(zlib.compress(b"foo"))
-        data += compress.flush()
+        data = _compress(DEFLATE_FOO, 16 + zlib.MAX_WBITS)
 
         fp = BytesIO(data)
         r = HTTPResponse(fp, headers={"content-encoding": "deflate, gzip"})
@@ -373,13 +349,7 @@ class TestResponse:
         assert r.data == b"foo"
 
     def test_multi_decoding_gzip_gzip(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        data = compress.compress(b"foo")
-        data += compress.flush()
-
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        data = compress.compress(data)
-        data += compress.flush()
+        data = _compress(GZIP_FOO, 16 + zlib.MAX_WBITS)
 
         fp = BytesIO(data)
         r = HTTPResponse(fp, headers={"content-encoding": "gzip, gzip"})
@@ -568,9 +538,7 @@ class TestResponse:
             next(reader)
 
     def test_read_with_illegal_mix_decode_toggle(self) -> None:
-        data = zlib.compress(b"foo")
-
-        fp = BytesIO(data)
+        fp = BytesIO(DEFLATE_FOO)
 
         resp = HTTPResponse(
             fp, headers={"content-encoding": "deflate"}, preload_content=False
@@ -597,9 +565,7 @@ class TestResponse:
             resp.read(decode_content=False)
 
     def test_read_with_mix_decode_toggle(self) -> None:
-        data = zlib.compress(b"foo")
-
-        fp = BytesIO(data)
+        fp = BytesIO(DEFLATE_FOO)
 
         resp = HTTPResponse(
             fp, headers={"content-encoding": "deflate"}, preload_content=False
@@ -614,8 +580,7 @@ class TestResponse:
 
         assert next(stream) == b"fo"
         assert next(stream) == b"o"
-        with pytest.raises(StopIteration):
-            next(stream)
+        assert next(stream, SENTINEL) is SENTINEL
 
     def test_streaming_tell(self) -> None:
         fp = BytesIO(b"foo")
@@ -632,32 +597,22 @@ class TestResponse:
         assert 3 == position
         assert position == resp.tell()
 
-        with pytest.raises(StopIteration):
-            next(stream)
-
-    def test_gzipped_streaming(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        data = compress.compress(b"foo")
-        data += compress.flush()
+        assert next(stream, SENTINEL) is SENTINEL
 
+    @pytest.mark.parametrize("content_encoding, data", ENCODED_FOO_CASES)
+    def test_decoded_streaming(self, content_encoding: str, data: bytes) -> None:
         fp = BytesIO(data)
         resp = HTTPResponse(
-            fp, headers={"content-encoding": "gzip"}, preload_content=False
+            fp, headers={"content-encoding": content_encoding}, preload_content=False
         )
         stream = resp.stream(2)
 
         assert next(stream) == b"fo"
         assert next(stream) == b"o"
-        with pytest.raises(StopIteration):
-            next(stream)
+        assert next(stream, SENTINEL) is SENTINEL
 
     def test_gzipped_streaming_tell(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-        uncompressed_data = b"foo"
-        data = compress.compress(uncompressed_data)
-        data += compress.flush()
-
-        fp = BytesIO(data)
+        fp = BytesIO(GZIP_FOO)
         resp = HTTPResponse(
             fp, headers={"content-encoding": "gzip"}, preload_content=False
         )
@@ -665,12 +620,11 @@ class TestResponse:
 
         # Read everything
         payload = next(stream)
-        assert payload == uncompressed_data
+        assert payload == b"foo"
 
-        assert len(data) == resp.tell()
+        assert len(GZIP_FOO) == resp.tell()
 
-        with pytest.raises(StopIteration):
-            next(stream)
+        assert next(stream, SENTINEL) is SENTINEL
 
     def test_deflate_streaming_tell_intermediate_point(self) -> None:
         # Ensure that ``tell()`` returns the correct number of bytes when
@@ -685,17 +639,24 @@ class TestResponse:
             """
 
             def __init__(self, payload: bytes, payload_part_size: int) -> None:
-                self.payloads = [
-                    payload[i * payload_part_size : (i + 1) * payload_part_size]
+                # Slicing the memoryview doesn't copy, bytes are only
+                # materialized when a part is actually read.
+                self._mv = memoryview(payload)
+                self._offsets = deque(
+                    (
+                        i * payload_part_size,
+                        min((i + 1) * payload_part_size, len(payload)),
+                    )
                     for i in range(NUMBER_OF_READS + 1)
-                ]
+                )
 
-                assert b"".join(self.payloads) == payload
+                assert sum(end - start for start, end in self._offsets) == len(payload)
 
             def read(self, _: int) -> bytes:  # type: ignore[override]
                 # Amount is unused.
-                if len(self.payloads) > 0:
-                    return self.payloads.pop(0)
+                if self._offsets:
+                    start, end = self._offsets.popleft()
+                    return bytes(self._mv[start:end])
                 return b""
 
         uncompressed_data = zlib.decompress(ZLIB_PAYLOAD)
@@ -710,8 +671,7 @@ class TestResponse:
         parts_positions = [(part, resp.tell()) for part in stream]
         end_of_stream = resp.tell()
 
-        with pytest.raises(StopIteration):
-            next(stream)
+        assert next(stream, SENTINEL) is SENTINEL
 
         parts, positions = zip(*parts_positions)
 
@@ -742,43 +702,12 @@ class TestResponse:
             expected_lengths = [PART_SIZE] * whole_parts + [expected_last_part_size]
         assert expected_lengths == [len(part) for part in parts]
 
-    def test_deflate_streaming(self) -> None:
-        data = zlib.compress(b"foo")
-
-        fp = BytesIO(data)
-        resp = HTTPResponse(
-            fp, headers={"content-encoding": "deflate"}, preload_content=False
-        )
-        stream = resp.stream(2)
-
-        assert next(stream) == b"fo"
-        assert next(stream) == b"o"
-        with pytest.raises(StopIteration):
-            next(stream)
-
-    def test_deflate2_streaming(self) -> None:
-        compress = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
-        data = compress.compress(b"foo")
-        data += compress.flush()
-
-        fp = BytesIO(data)
-        resp = HTTPResponse(
-            fp, headers={"content-encoding": "deflate"}, preload_content=False
-        )
-        stream = resp.stream(2)
-
-        assert next(stream) == b"fo"
-        assert next(stream) == b"o"
-        with pytest.raises(StopIteration):
-            next(stream)
-
     def test_empty_stream(self) -> None:
         fp = BytesIO(b"")
         resp = HTTPResponse(fp, preload_content=False)
         stream = resp.stream(2, decode_content=False)
 
-        with pytest.raises(StopIteration):
-            next(stream)
+        assert next(stream, SENTINEL) is SENTINEL
 
     @pytest.mark.parametrize(
         "preload_content, amt",
@@ -905,8 +834,7 @@ class TestResponse:
 
         assert next(stream) == b"fo"
         assert next(stream) == b"o"
-        with pytest.raises(StopIteration):
-            next(stream)
+        assert next(stream, SENTINEL) is SENTINEL
 
     def test_mock_transfer_encoding_chunked(self) -> None:
         stream = [b"fo", b"o", b"bar"]
@@ -925,9 +853,7 @@ class TestResponse:
 
         def stream() -> typing.Generator[bytes, None, None]:
             # Set up a generator to chunk the gzipped body
-            compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-            data = compress.compress(b"foobar")
-            data += compress.flush()
+            data = _compress(b"foobar", 16 + zlib.MAX_WBITS)
             for i in range(0, len(data), 2):
                 yield data[i : i + 2]
 
@@ -1094,7 +1020,7 @@ class TestResponse:
         fp = BytesIO(b"")
         resp = HTTPResponse(fp)
         assert resp.retries is None
-        retry = Retry()
+        retry = DEFAULT_RETRY
         resp = HTTPResponse(fp, retries=retry)
         assert resp.retries == retry
 
@@ -1155,9 +1081,7 @@ class TestResponse:
     def test__iter__decode_content(self) -> None:
         def stream() -> typing.Generator[bytes, None, None]:
             # Set up a generator to chunk the gzipped body
-            compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
-            data = compress.compress(b"foo\nbar")
-            data += compress.flush()
+            data = _compress(b"foo\nbar", 16 + zlib.MAX_WBITS)
             for i in range(0, len(data), 2):
                 yield data[i : i + 2]
 